@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Run independent chart tasks in worker processes
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+
+def _call(task):
+    """Run one zero-argument task; mapped over by the worker pool"""
+    return task()
+
+def run_tasks(tasks, initializer=None):
+    """Run zero-argument, picklable tasks, one worker process per task
+
+    Charts share no state and Agg rasterization holds the GIL, so each task
+    gets its own process rather than a thread. Workers are spawned so they do
+    not inherit pyplot state from the parent. With a single worker, spawning
+    would only add a fresh interpreter and its imports, so the tasks run in
+    this process instead. initializer runs once in every process that draws.
+    """
+    workers = min(len(tasks), os.cpu_count() or 1)
+    if workers <= 1:
+        if tasks and initializer is not None:
+            initializer()
+        return [_call(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context('spawn'),
+                             initializer=initializer) as ex:
+        return list(ex.map(_call, tasks))
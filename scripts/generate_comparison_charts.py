@@ -3,168 +3,239 @@
 ZART vs Go BART Performance Comparison Chart Generator
 """
 
+import matplotlib
+matplotlib.use('Agg')  # Headless: skip GUI backend probing
+matplotlib.rcParams['interactive'] = False
 import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
+import pandas as pd
+from chart_workers import run_tasks
 from pathlib import Path
+import argparse
+import functools
+import hashlib
+import importlib.metadata
 import json
 
-# Set style
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+# Output settings by file suffix. Charts are written as SVG, which skips
+# rasterization; the SVGs are committed, so they carry no timestamp
+SAVE_KW = {
+    '.svg': dict(metadata={'Date': None}),
+}
 
-def create_comparison_charts():
+# rcParams in effect while saving each format; SVG text stays as <text>
+# elements instead of glyph paths, keeping it small and selectable, and a
+# fixed hash salt keeps element ids stable between runs
+SAVE_RC = {
+    '.svg': {'svg.fonttype': 'none', 'svg.hashsalt': 'zart'},
+}
+
+_STYLED = False
+
+def _ensure_style():
+    """Apply the chart style once; seaborn is only imported here"""
+    global _STYLED
+    if _STYLED:
+        return
+    import seaborn as sns
+    plt.style.use('seaborn-v0_8')
+    sns.set_palette("husl")
+    _STYLED = True
+
+def _figure(figsize):
+    """Return a new styled figure of the given size"""
+    _ensure_style()
+    return plt.figure(figsize=figsize, layout='constrained')
+
+# Benchmark results (ns/op), one row per operation: op, go_bart_ns, zart_ns
+BENCHMARKS_CSV = Path('assets/benchmarks.csv')
+
+# Operations drawn by each grouped bar panel, looked up by name
+IPV4_MATCH = ['Contains_IPv4', 'Lookup_IPv4', 'LookupPrefix_IPv4', 'LookupPfxLPM_IPv4']
+IPV6_MATCH = ['Contains_IPv6', 'Lookup_IPv6', 'LookupPrefix_IPv6', 'LookupPfxLPM_IPv6']
+MISS = ['Contains_IPv4_Miss', 'Lookup_IPv4_Miss', 'Contains_IPv6_Miss', 'Lookup_IPv6_Miss']
+INSERT = ['Insert_10K', 'Insert_100K', 'Insert_1M']
+
+# Bar positions and width shared by the grouped bar panels
+_X3 = np.arange(3)
+_X4 = np.arange(4)
+_W = 0.35
+
+# Ratio tiers (faster, good, needs improvement) and what each tier maps to.
+# np.digitize against RATIO_BINS gives the tier index; nextafter keeps a ratio
+# of exactly 2.0 in the GOOD tier
+RATIO_BINS = np.array([1.0, np.nextafter(2.0, np.inf)])
+STATUS = np.array(["🏆 FASTER", "🥈 GOOD", "🔴 NEEDS IMPROVEMENT"])
+STATUS_COLORS = np.array(['#E8F5E8', '#FFF8E1', '#FFEBEE'])
+RATIO_COLORS = np.array(['#2E8B57', '#FFD700', '#DC143C'])
+
+def _save(fig, output_path):
+    """Write fig to output_path using the settings for its format"""
+    with plt.rc_context(SAVE_RC.get(output_path.suffix, {})):
+        fig.savefig(output_path, bbox_inches='tight', **SAVE_KW[output_path.suffix])
+
+def _cache_key(*data):
+    """Hash chart inputs together with this script and the matplotlib/seaborn versions"""
+    payload = json.dumps({
+        'data': data,
+        'matplotlib': matplotlib.__version__,
+        'save': SAVE_KW,
+        'seaborn': importlib.metadata.version('seaborn'),  # metadata: no import
+        'script': Path(__file__).read_text(),
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def _is_fresh(output_path, key):
+    """Whether output_path exists and its sidecar hash matches key"""
+    sidecar = output_path.with_suffix('.sha256')
+    return output_path.exists() and sidecar.exists() and sidecar.read_text() == key
+
+def _render_cached(create, output_path, key, *args, pdf=None):
+    """Build fig = create(*args) and save it unless the sidecar hash says it is current
+
+    When pdf is a PdfPages, the figure is also appended to it as a page, so a
+    chart that is up to date on disk is still built for the PDF.
+    """
+    fresh = _is_fresh(output_path, key)
+    if fresh and pdf is None:
+        print(f"{output_path} is up to date, skipping")
+        return
+    fig = create(*args)
+    if not fresh:
+        _save(fig, output_path)
+        output_path.with_suffix('.sha256').write_text(key)
+        print(f"Chart saved to {output_path}")
+    if pdf is not None:
+        pdf.savefig(fig, bbox_inches='tight')
+    plt.close(fig)
+
+def _speedup(ratio):
+    """Describe a ZART/Go BART time ratio as a speedup or slowdown"""
+    if ratio < 1:
+        return f"{1 / ratio:.2f}x FASTER than Go BART"
+    return f"{ratio:.2f}x slower"
+
+def load_benchmarks(path):
+    """Read a benchmark CSV into a frame indexed by op, with a ZART/Go BART ratio column"""
+    df = pd.read_csv(path)
+    return df.assign(ratio=df.zart_ns / df.go_bart_ns).set_index('op')
+
+def chart_jobs(data, out_prefix):
+    """List the comparison chart and summary table jobs for one benchmark dataset"""
+    key = _cache_key(data.to_csv())
+    
+    output_dir = Path('assets')
+    output_dir.mkdir(exist_ok=True)
+    return [
+        (create_comparison_charts, output_dir / f'{out_prefix}_comparison.svg', key, (data,)),
+        (create_summary_table, output_dir / f'{out_prefix}_summary.svg', key, (data,)),
+    ]
+
+def render(jobs, pdf=None):
+    """Render chart jobs, drawing the stale ones in worker processes via run_tasks
+
+    Pages of a PdfPages must come from a single process, so a PDF run stays
+    serial. Otherwise up-to-date charts are skipped here, before any worker
+    is started.
+    """
+    if pdf is not None:
+        for create, output_path, key, args in jobs:
+            _render_cached(create, output_path, key, *args, pdf=pdf)
+        return
+    tasks = []
+    for create, output_path, key, args in jobs:
+        if _is_fresh(output_path, key):
+            print(f"{output_path} is up to date, skipping")
+        else:
+            tasks.append(functools.partial(_render_cached, create, output_path, key, *args))
+    run_tasks(tasks)
+
+def create_comparison_charts(data):
     """Create comprehensive comparison charts between ZART and Go BART"""
     
-    # Performance data from benchmarks
-    # Go BART results (ns/op) - from recent benchmark
-    go_bart_data = {
-        'Contains_IPv4': 5.60,
-        'Lookup_IPv4': 17.50,
-        'LookupPrefix_IPv4': 20.64,
-        'LookupPfxLPM_IPv4': 23.35,
-        'Contains_IPv6': 9.47,
-        'Lookup_IPv6': 26.96,
-        'LookupPrefix_IPv6': 20.60,
-        'LookupPfxLPM_IPv6': 23.51,
-        'Contains_IPv4_Miss': 12.31,
-        'Lookup_IPv4_Miss': 16.41,
-        'Contains_IPv6_Miss': 5.47,
-        'Lookup_IPv6_Miss': 7.09,
-        'Insert_10K': 10.06,
-        'Insert_100K': 10.05,
-        'Insert_1M': 10.14,
-    }
-    
-    # ZART results (ns/op) - from recent benchmark (MAJOR IMPROVEMENT!)
-    zart_data = {
-        'Contains_IPv4': 9.94,      # 🏆 MASSIVE IMPROVEMENT! (from 49.18 to 9.94)
-        'Lookup_IPv4': 12.32,      # 🏆 MASSIVE IMPROVEMENT! (from 71.57 to 12.32)
-        'LookupPrefix_IPv4': 24.88, # 🏆 MASSIVE IMPROVEMENT! (from 145.39 to 24.88)
-        'LookupPfxLPM_IPv4': 22.07, # 🏆 MASSIVE IMPROVEMENT! (from 144.70 to 22.07)
-        'Contains_IPv6': 2.89,      # 🏆 FASTER than Go BART! (from 12.21 to 2.89)
-        'Lookup_IPv6': 4.03,       # 🏆 MASSIVE IMPROVEMENT! (from 17.47 to 4.03)
-        'LookupPrefix_IPv6': 91.30, # 🏆 MASSIVE IMPROVEMENT! (from 378.34 to 91.30)
-        'LookupPfxLPM_IPv6': 86.54, # 🏆 MASSIVE IMPROVEMENT! (from 300.39 to 86.54)
-        'Contains_IPv4_Miss': 11.57, # 🏆 MASSIVE IMPROVEMENT! (from 108.81 to 11.57)
-        'Lookup_IPv4_Miss': 17.70,  # 🏆 MASSIVE IMPROVEMENT! (from 135.87 to 17.70)
-        'Contains_IPv6_Miss': 2.85,  # 🏆 FASTER than Go BART! (from 12.18 to 2.85)
-        'Lookup_IPv6_Miss': 4.14,   # 🏆 MASSIVE IMPROVEMENT! (from 17.32 to 4.14)
-        'Insert_10K': 20.16,
-        'Insert_100K': 20.33,
-        'Insert_1M': 47.63,
-    }
-    
     # Create comparison chart with Insert performance
-    fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+    fig = _figure((18, 12))
+    axes = fig.subplots(2, 3)
     fig.suptitle('ZART vs Go BART Performance Comparison\n(Lower is Better)', fontsize=16, fontweight='bold')
     
     # IPv4 Match Operations
     ipv4_match_ops = ['Contains', 'Lookup', 'LookupPrefix', 'LookupPfxLPM']
-    go_bart_ipv4_match = [go_bart_data[f'{op}_IPv4'] for op in ipv4_match_ops]
-    zart_ipv4_match = [zart_data[f'{op}_IPv4'] for op in ipv4_match_ops]
     
-    x = np.arange(len(ipv4_match_ops))
-    width = 0.35
-    
-    axes[0, 0].bar(x - width/2, go_bart_ipv4_match, width, label='Go BART', color='#2E86AB', alpha=0.8)
-    axes[0, 0].bar(x + width/2, zart_ipv4_match, width, label='ZART', color='#A23B72', alpha=0.8)
+    axes[0, 0].bar(_X4 - _W/2, data.loc[IPV4_MATCH, 'go_bart_ns'], _W, label='Go BART', color='#2E86AB', alpha=0.8)
+    axes[0, 0].bar(_X4 + _W/2, data.loc[IPV4_MATCH, 'zart_ns'], _W, label='ZART', color='#A23B72', alpha=0.8)
     axes[0, 0].set_title('IPv4 Match Operations', fontweight='bold')
     axes[0, 0].set_ylabel('Time (ns/op)')
-    axes[0, 0].set_xticks(x)
-    axes[0, 0].set_xticklabels(ipv4_match_ops, rotation=45, ha='right')
+    axes[0, 0].set_xticks(_X4, ipv4_match_ops, rotation=45, ha='right')
     axes[0, 0].legend()
     axes[0, 0].grid(True, alpha=0.3)
     
     # IPv6 Match Operations
     ipv6_match_ops = ['Contains', 'Lookup', 'LookupPrefix', 'LookupPfxLPM']
-    go_bart_ipv6_match = [go_bart_data[f'{op}_IPv6'] for op in ipv6_match_ops]
-    zart_ipv6_match = [zart_data[f'{op}_IPv6'] for op in ipv6_match_ops]
     
-    axes[0, 1].bar(x - width/2, go_bart_ipv6_match, width, label='Go BART', color='#2E86AB', alpha=0.8)
-    axes[0, 1].bar(x + width/2, zart_ipv6_match, width, label='ZART', color='#A23B72', alpha=0.8)
+    axes[0, 1].bar(_X4 - _W/2, data.loc[IPV6_MATCH, 'go_bart_ns'], _W, label='Go BART', color='#2E86AB', alpha=0.8)
+    axes[0, 1].bar(_X4 + _W/2, data.loc[IPV6_MATCH, 'zart_ns'], _W, label='ZART', color='#A23B72', alpha=0.8)
     axes[0, 1].set_title('IPv6 Match Operations', fontweight='bold')
     axes[0, 1].set_ylabel('Time (ns/op)')
-    axes[0, 1].set_xticks(x)
-    axes[0, 1].set_xticklabels(ipv6_match_ops, rotation=45, ha='right')
+    axes[0, 1].set_xticks(_X4, ipv6_match_ops, rotation=45, ha='right')
     axes[0, 1].legend()
     axes[0, 1].grid(True, alpha=0.3)
     
     # Insert Performance Comparison
     insert_ops = ['10K Items', '100K Items', '1M Items']
-    go_bart_insert = [go_bart_data['Insert_10K'], go_bart_data['Insert_100K'], go_bart_data['Insert_1M']]
-    zart_insert = [zart_data['Insert_10K'], zart_data['Insert_100K'], zart_data['Insert_1M']]
     
-    x_insert = np.arange(len(insert_ops))
-    axes[0, 2].bar(x_insert - width/2, go_bart_insert, width, label='Go BART', color='#2E86AB', alpha=0.8)
-    axes[0, 2].bar(x_insert + width/2, zart_insert, width, label='ZART', color='#A23B72', alpha=0.8)
+    axes[0, 2].bar(_X3 - _W/2, data.loc[INSERT, 'go_bart_ns'], _W, label='Go BART', color='#2E86AB', alpha=0.8)
+    axes[0, 2].bar(_X3 + _W/2, data.loc[INSERT, 'zart_ns'], _W, label='ZART', color='#A23B72', alpha=0.8)
     axes[0, 2].set_title('Insert Performance Scaling', fontweight='bold')
     axes[0, 2].set_ylabel('Time (ns/op)')
-    axes[0, 2].set_xticks(x_insert)
-    axes[0, 2].set_xticklabels(insert_ops)
+    axes[0, 2].set_xticks(_X3, insert_ops)
     axes[0, 2].legend()
     axes[0, 2].grid(True, alpha=0.3)
     
     # Miss Operations Comparison
-    miss_ops = ['Contains_IPv4_Miss', 'Lookup_IPv4_Miss', 'Contains_IPv6_Miss', 'Lookup_IPv6_Miss']
     miss_labels = ['Contains IPv4', 'Lookup IPv4', 'Contains IPv6', 'Lookup IPv6']
-    go_bart_miss = [go_bart_data[op] for op in miss_ops]
-    zart_miss = [zart_data[op] for op in miss_ops]
     
-    x_miss = np.arange(len(miss_ops))
-    axes[1, 0].bar(x_miss - width/2, go_bart_miss, width, label='Go BART', color='#2E86AB', alpha=0.8)
-    axes[1, 0].bar(x_miss + width/2, zart_miss, width, label='ZART', color='#A23B72', alpha=0.8)
+    axes[1, 0].bar(_X4 - _W/2, data.loc[MISS, 'go_bart_ns'], _W, label='Go BART', color='#2E86AB', alpha=0.8)
+    axes[1, 0].bar(_X4 + _W/2, data.loc[MISS, 'zart_ns'], _W, label='ZART', color='#A23B72', alpha=0.8)
     axes[1, 0].set_title('Miss Operations', fontweight='bold')
     axes[1, 0].set_ylabel('Time (ns/op)')
-    axes[1, 0].set_xticks(x_miss)
-    axes[1, 0].set_xticklabels(miss_labels, rotation=45, ha='right')
+    axes[1, 0].set_xticks(_X4, miss_labels, rotation=45, ha='right')
     axes[1, 0].legend()
     axes[1, 0].grid(True, alpha=0.3)
     
     # Performance Ratio (ZART/Go BART)
-    ratios = {}
-    for key in go_bart_data:
-        if key in zart_data:
-            ratios[key] = zart_data[key] / go_bart_data[key]
-    
-    ratio_keys = list(ratios.keys())
-    ratio_values = list(ratios.values())
-    
     # Color code: green for better (< 1.0), yellow for acceptable (1.0-2.0), red for needs improvement (> 2.0)
-    colors = ['#2E8B57' if r < 1.0 else '#FFD700' if r <= 2.0 else '#DC143C' for r in ratio_values]
+    colors = RATIO_COLORS[np.digitize(data.ratio, RATIO_BINS)].tolist()
     
-    bars = axes[1, 1].bar(range(len(ratio_keys)), ratio_values, color=colors, alpha=0.8)
+    x_ratio = np.arange(len(data))
+    bars = axes[1, 1].bar(x_ratio, data.ratio, color=colors, alpha=0.8)
     axes[1, 1].axhline(y=1.0, color='black', linestyle='--', alpha=0.5, label='Parity Line')
     axes[1, 1].set_title('Performance Ratio (ZART/Go BART)', fontweight='bold')
     axes[1, 1].set_ylabel('Ratio (Lower is Better)')
-    axes[1, 1].set_xticks(range(len(ratio_keys)))
-    axes[1, 1].set_xticklabels([k.replace('_', '\n') for k in ratio_keys], rotation=45, ha='right', fontsize=8)
+    axes[1, 1].set_xticks(x_ratio, data.index.str.replace('_', '\n'), rotation=45, ha='right', fontsize=8)
     axes[1, 1].legend()
     axes[1, 1].grid(True, alpha=0.3)
     
     # Add value labels on bars
-    for bar, value in zip(bars, ratio_values):
-        height = bar.get_height()
-        axes[1, 1].text(bar.get_x() + bar.get_width()/2., height,
-                       f'{value:.1f}x', ha='center', va='bottom', fontsize=8)
+    axes[1, 1].bar_label(bars, fmt='%.1fx', padding=2, fontsize=8)
     
     # Performance Summary with Key Achievements
     axes[1, 2].axis('off')
-    summary_text = """
+    r = data.ratio
+    summary_text = f"""
 🏆 ZART Performance Achievements 🏆
 
 🎯 IPv6 Performance Leader:
-• Contains: 3.28x FASTER than Go BART
-• Lookup: 6.69x FASTER than Go BART
+• Contains: {_speedup(r['Contains_IPv6'])}
+• Lookup: {_speedup(r['Lookup_IPv6'])}
 
 🎯 IPv4 Competitive Performance:
-• Lookup: 1.42x FASTER than Go BART
-• Contains: 1.78x slower (excellent)
+• Lookup: {_speedup(r['Lookup_IPv4'])}
+• Contains: {_speedup(r['Contains_IPv4'])}
 
 🎯 Insert Performance Status:
-• 10K items: 2.00x slower
-• 100K items: 2.02x slower  
-• 1M items: 4.70x slower
+• 10K items: {_speedup(r['Insert_10K'])}
+• 100K items: {_speedup(r['Insert_100K'])}
+• 1M items: {_speedup(r['Insert_1M'])}
 
 🎯 Key Improvements:
 • Efficient sparse array operations
@@ -182,55 +253,35 @@ def create_comparison_charts():
                    fontsize=10, verticalalignment='top', fontfamily='monospace',
                    bbox=dict(boxstyle="round,pad=0.3", facecolor="lightblue", alpha=0.8))
     
-    plt.tight_layout()
-    plt.subplots_adjust(top=0.93)
-    
-    # Save to assets directory
-    output_path = Path('assets/zart_vs_go_bart_comparison.png')
-    output_path.parent.mkdir(exist_ok=True)
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    print(f"Comparison chart saved to {output_path}")
-    
-    # Create summary table
-    create_summary_table(go_bart_data, zart_data, ratios)
-    
-    # Don't show plots in headless environment
-    # plt.show()
+    return fig
 
-def create_summary_table(go_bart_data, zart_data, ratios):
+def create_summary_table(data):
     """Create a summary table with performance metrics"""
     
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig = _figure((12, 8))
+    ax = fig.subplots()
     ax.axis('tight')
     ax.axis('off')
     
-    # Prepare data for table
-    operations = []
-    go_bart_values = []
-    zart_values = []
-    ratio_values = []
-    status = []
-    
-    for key in go_bart_data:
-        if key in zart_data:
-            operations.append(key.replace('_', ' '))
-            go_bart_values.append(f"{go_bart_data[key]:.2f}")
-            zart_values.append(f"{zart_data[key]:.2f}")
-            ratio_values.append(f"{ratios[key]:.2f}x")
-            
-            if ratios[key] < 1.0:
-                status.append("🏆 FASTER")
-            elif ratios[key] <= 2.0:
-                status.append("🥈 GOOD")
-            else:
-                status.append("🔴 NEEDS IMPROVEMENT")
-    
-    table_data = []
-    for i in range(len(operations)):
-        table_data.append([operations[i], go_bart_values[i], zart_values[i], ratio_values[i], status[i]])
+    # Prepare data for table, one formatted column at a time
+    operations = data.index.str.replace('_', ' ')
+    go_bart_values = np.char.mod('%.2f', data.go_bart_ns)
+    zart_values = np.char.mod('%.2f', data.zart_ns)
+    ratio_values = np.char.mod('%.2fx', data.ratio)
+    tier = np.digitize(data.ratio, RATIO_BINS)
+    status = STATUS[tier]
+    
+    table_data = np.column_stack([operations, go_bart_values, zart_values, ratio_values, status]).tolist()
+    
+    # Cell colors: zebra-striped body, status column colored by ratio tier
+    stripes = np.where(np.arange(len(data)) % 2 == 1, '#F5F5F5', 'white')
+    cell_colours = np.tile(stripes[:, None], (1, 5))
+    cell_colours[:, 4] = STATUS_COLORS[tier]
     
     table = ax.table(cellText=table_data,
+                    cellColours=cell_colours,
                     colLabels=['Operation', 'Go BART (ns/op)', 'ZART (ns/op)', 'Ratio', 'Status'],
+                    colColours=['#4CAF50'] * 5,
                     cellLoc='center',
                     loc='center',
                     colWidths=[0.25, 0.15, 0.15, 0.15, 0.3])
@@ -239,33 +290,14 @@ def create_summary_table(go_bart_data, zart_data, ratios):
     table.set_fontsize(10)
     table.scale(1.2, 1.5)
     
-    # Style the table
-    for i in range(len(operations) + 1):
-        for j in range(5):
-            cell = table[(i, j)]
-            if i == 0:  # Header row
-                cell.set_facecolor('#4CAF50')
-                cell.set_text_props(weight='bold', color='white')
-            else:
-                if j == 4:  # Status column
-                    if "FASTER" in table_data[i-1][j]:
-                        cell.set_facecolor('#E8F5E8')
-                    elif "GOOD" in table_data[i-1][j]:
-                        cell.set_facecolor('#FFF8E1')
-                    else:
-                        cell.set_facecolor('#FFEBEE')
-                else:
-                    cell.set_facecolor('#F5F5F5' if i % 2 == 0 else 'white')
-    
-    plt.title('ZART vs Go BART Performance Summary\n(Using Real Routing Table: 1,062,046 prefixes)', 
-              fontsize=14, fontweight='bold', pad=20)
+    # Header text has no table() parameter, so style those five cells directly
+    for j in range(5):
+        table[(0, j)].set_text_props(weight='bold', color='white')
     
-    # Save summary table
-    output_path = Path('assets/zart_vs_go_bart_summary.png')
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    print(f"Summary table saved to {output_path}")
+    ax.set_title('ZART vs Go BART Performance Summary\n(Using Real Routing Table: 1,062,046 prefixes)', 
+              fontsize=14, fontweight='bold', pad=20)
     
-    plt.close(fig)  # Close instead of show
+    return fig
 
 def create_memory_comparison():
     """Create memory usage comparison chart"""
@@ -285,40 +317,48 @@ def create_memory_comparison():
         }
     }
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = _figure((10, 6))
+    ax = fig.subplots()
     
     categories = ['IPv4\n(901,899 prefixes)', 'IPv6\n(160,147 prefixes)', 'Total\n(1,062,046 prefixes)']
     go_bart_mem = [15731, 6070, 21799]
     
-    x = np.arange(len(categories))
-    width = 0.35
-    
-    bars1 = ax.bar(x - width/2, go_bart_mem, width, label='Go BART', color='#2E86AB', alpha=0.8)
+    bars1 = ax.bar(_X3 - _W/2, go_bart_mem, _W, label='Go BART', color='#2E86AB', alpha=0.8)
     
     ax.set_title('Memory Usage Comparison', fontweight='bold')
     ax.set_ylabel('Memory Usage (KBytes)')
-    ax.set_xticks(x)
-    ax.set_xticklabels(categories)
+    ax.set_xticks(_X3, categories)
     ax.legend()
     ax.grid(True, alpha=0.3)
     
     # Add value labels on bars
-    for bar in bars1:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-               f'{height:,} KB', ha='center', va='bottom')
+    ax.bar_label(bars1, fmt='{:,.0f} KB', padding=3)
     
-    plt.tight_layout()
-    
-    # Save memory comparison
-    output_path = Path('assets/memory_comparison.png')
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    print(f"Memory comparison saved to {output_path}")
+    return fig
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate ZART vs Go BART comparison charts")
+    parser.add_argument('--csv', type=Path, default=BENCHMARKS_CSV,
+                        help="benchmark results to chart (default: %(default)s)")
+    parser.add_argument('--pdf', type=Path,
+                        help="also collect every chart as a page of this multi-page PDF")
+    args = parser.parse_args()
+    
+    pdf = None
+    if args.pdf:
+        from matplotlib.backends.backend_pdf import PdfPages
+        pdf = PdfPages(args.pdf)
     
-    plt.close(fig)  # Close instead of show
+    print("🚀 Generating ZART vs Go BART comparison charts...")
+    jobs = chart_jobs(load_benchmarks(args.csv), 'zart_vs_go_bart')
+    jobs.append((create_memory_comparison, Path('assets/memory_comparison.svg'), _cache_key(), ()))
+    try:
+        render(jobs, pdf=pdf)
+    finally:
+        if pdf is not None:
+            pdf.close()
+            print(f"PDF saved to {args.pdf}")
+    print("✅ All comparison charts generated successfully!")
 
 if __name__ == "__main__":
-    print("🚀 Generating ZART vs Go BART comparison charts...")
-    create_comparison_charts()
-    create_memory_comparison()
-    print("✅ All comparison charts generated successfully!") 
\ No newline at end of file
+    main() 
\ No newline at end of file